@@ -5,20 +5,35 @@ AI-powered job matching using NLP and ML
 """
 
 import json
+import os
+import hashlib
+import logging
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 import spacy
 import re
 
+# Bump when the layout of the score store changes so old stores are rebuilt
+SCORE_STORE_VERSION = 1
+
+# Skill categories whose names are also matched against NER entities
+ENTITY_SKILL_CATEGORIES = ['programming', 'web_dev', 'data_science']
+
 class OffCampusJobMatcher:
-    def __init__(self):
+    def __init__(self, skill_database_path=None):
+        self.logger = logging.getLogger('OffCampusJobMatcher')
         self.nlp = spacy.load("en_core_web_sm")
         self.vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
-        self.skill_database = self.load_skill_database()
+        self.skill_database = self.load_skill_database(skill_database_path)
         
-    def load_skill_database(self):
+    def load_skill_database(self, skill_database_path=None):
         """Load comprehensive skill database"""
+        if skill_database_path:
+            # Custom skill list as {category: [skills]} for tuning without code edits
+            with open(skill_database_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        
         return {
             'programming': ['Python', 'JavaScript', 'Java', 'C++', 'C#', 'Go', 'Rust', 'TypeScript'],
             'web_dev': ['React', 'Angular', 'Vue', 'Django', 'Flask', 'Node.js', 'Express'],
@@ -28,16 +43,31 @@ class OffCampusJobMatcher:
             'soft_skills': ['Communication', 'Teamwork', 'Problem Solving', 'Leadership']
         }
     
+    
     def calculate_job_match_score(self, resume_text, job_description):
         """Calculate match score between resume and job"""
         # Text similarity
         text_similarity = self.calculate_text_similarity(resume_text, job_description)
         
         # Skill matching
-        skill_match = self.calculate_skill_match(resume_text, job_description)
+        resume_skills = self.extract_skills_from_text(resume_text)
+        job_skills = self.extract_skills_from_text(job_description)
+        skill_match = self.skill_overlap(resume_skills, job_skills)
         
         # Experience level matching
-        experience_match = self.match_experience_level(resume_text, job_description)
+        experience_match = self.experience_score(
+            self.extract_experience_years(resume_text),
+            self.extract_experience_years(job_description)
+        )
+        
+        return self.build_match_result(
+            text_similarity, skill_match, experience_match,
+            self.compare_skills(resume_skills, job_skills)
+        )
+    
+    def build_match_result(self, text_similarity, skill_match, experience_match, skill_comparison):
+        """Combine component scores into the weighted match result"""
+        matched_skills, missing_skills = skill_comparison
         
         # Weighted score
         final_score = (text_similarity * 0.4) + (skill_match * 0.4) + (experience_match * 0.2)
@@ -47,8 +77,8 @@ class OffCampusJobMatcher:
             'text_similarity': round(text_similarity * 100, 2),
             'skill_match': round(skill_match * 100, 2),
             'experience_match': round(experience_match * 100, 2),
-            'matched_skills': self.extract_matched_skills(resume_text, job_description),
-            'missing_skills': self.extract_missing_skills(resume_text, job_description)
+            'matched_skills': matched_skills,
+            'missing_skills': missing_skills
         }
     
     def calculate_text_similarity(self, text1, text2):
@@ -56,41 +86,323 @@ class OffCampusJobMatcher:
         try:
             tfidf_matrix = self.vectorizer.fit_transform([text1, text2])
             similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            return similarity[0][0]
+            return float(similarity[0][0])
         except:
             return 0.0
     
+    def calculate_skill_match(self, resume_text, job_description):
+        """Fraction of the job's skills covered by the resume"""
+        return self.skill_overlap(
+            self.extract_skills_from_text(resume_text),
+            self.extract_skills_from_text(job_description)
+        )
+    
+    def skill_overlap(self, resume_skills, job_skills):
+        """Fraction of job skills present in resume skills"""
+        if not job_skills:
+            return 0.0
+        matched, _ = self.compare_skills(resume_skills, job_skills)
+        return len(matched) / len(job_skills)
+    
+    def compare_skills(self, resume_skills, job_skills):
+        """Split skills into (matched, missing) using case-insensitive comparison"""
+        resume_lower = {skill.lower() for skill in resume_skills}
+        job_lower = {skill.lower() for skill in job_skills}
+        
+        matched = sorted(skill for skill in resume_skills if skill.lower() in job_lower)
+        missing = sorted(skill for skill in job_skills if skill.lower() not in resume_lower)
+        return matched, missing
+    
+    def match_experience_level(self, resume_text, job_description):
+        """Score how well resume experience meets the job's requirement"""
+        return self.experience_score(
+            self.extract_experience_years(resume_text),
+            self.extract_experience_years(job_description)
+        )
+    
+    def extract_experience_years(self, text):
+        """Largest 'N years' figure in text (lower bound of ranges like 0-2 years)"""
+        matches = re.findall(r'(\d+)\s*(?:-\s*\d+\s*)?\+?\s*(?:years?|yrs?)\b', text, re.IGNORECASE)
+        return max((int(years) for years in matches), default=0)
+    
+    def experience_score(self, resume_years, required_years):
+        """Full score when experience meets the requirement, partial otherwise"""
+        if resume_years >= required_years:
+            return 1.0
+        return resume_years / required_years
+    
     def extract_matched_skills(self, resume_text, job_description):
         """Extract skills that match between resume and job"""
         resume_skills = self.extract_skills_from_text(resume_text)
         job_skills = self.extract_skills_from_text(job_description)
         
-        matched = []
-        for skill in resume_skills:
-            if any(job_skill.lower() == skill.lower() for job_skill in job_skills):
-                matched.append(skill)
-        
+        matched, _ = self.compare_skills(resume_skills, job_skills)
         return matched
     
+    def extract_missing_skills(self, resume_text, job_description):
+        """Extract job skills the resume does not mention"""
+        resume_skills = self.extract_skills_from_text(resume_text)
+        job_skills = self.extract_skills_from_text(job_description)
+        
+        _, missing = self.compare_skills(resume_skills, job_skills)
+        return missing
+    
     def extract_skills_from_text(self, text):
         """Extract technical skills from text"""
-        found_skills = []
-        text_lower = text.lower()
-        
-        for category, skills in self.skill_database.items():
-            for skill in skills:
-                if skill.lower() in text_lower:
-                    found_skills.append(skill)
+        found_skills = self.find_keyword_skills(text, self.all_skills())
         
         # Also find skills using NLP
+        found_skills += self.match_entity_skills(self.extract_entities(text))
+        
+        return list(set(found_skills))
+    
+    def all_skills(self):
+        """Flat list of every skill in the database"""
+        return [skill for skills in self.skill_database.values() for skill in skills]
+    
+    def find_keyword_skills(self, text, skills):
+        """Skills from the given list that appear verbatim in text"""
+        text_lower = text.lower()
+        return [skill for skill in skills if skill.lower() in text_lower]
+    
+    def extract_entities(self, text):
+        """ORG/PRODUCT entities that may name a tech skill"""
         doc = self.nlp(text)
-        for ent in doc.ents:
-            if ent.label_ == "ORG" or ent.label_ == "PRODUCT":
-                # Check if it's a known tech skill
-                if any(skill.lower() in ent.text.lower() for skill in 
-                       self.skill_database['programming'] + 
-                       self.skill_database['web_dev'] +
-                       self.skill_database['data_science']):
-                    found_skills.append(ent.text)
-        
-        return list(set(found_skills))
\ No newline at end of file
+        return [ent.text for ent in doc.ents if ent.label_ == "ORG" or ent.label_ == "PRODUCT"]
+    
+    def match_entity_skills(self, entities):
+        """Entities that contain a known tech skill"""
+        tech_skills = [skill.lower() for category in ENTITY_SKILL_CATEGORIES
+                       for skill in self.skill_database.get(category, [])]
+        return [ent for ent in entities if any(skill in ent.lower() for skill in tech_skills)]
+    
+    # ------------------------------------------------------------------
+    # Incremental re-scoring
+    # ------------------------------------------------------------------
+    
+    def fingerprint(self, value):
+        """Stable short hash of text or JSON-serializable data"""
+        if not isinstance(value, str):
+            value = json.dumps(value, sort_keys=True, default=str)
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()[:16]
+    
+    def skill_database_version(self):
+        """Version of the current skill database"""
+        return self.fingerprint(self.skill_database)
+    
+    def vectorizer_version(self):
+        """Version of the TF-IDF vectorizer configuration"""
+        return self.fingerprint(self.vectorizer.get_params())
+    
+    def load_score_store(self, store_path):
+        """Load stored scores, starting fresh if missing or outdated"""
+        empty_store = {
+            'store_version': SCORE_STORE_VERSION,
+            'skill_databases': {},
+            'resume': {},
+            'jobs': {}
+        }
+        
+        if not os.path.exists(store_path):
+            return empty_store
+        
+        try:
+            with open(store_path, 'r', encoding='utf-8') as f:
+                store = json.load(f)
+        except (OSError, ValueError) as e:
+            # The store is only a cache, so a damaged one is simply rebuilt
+            self.logger.warning(f"Unreadable score store {store_path}, rebuilding: {e}")
+            return empty_store
+        
+        if not isinstance(store, dict) or store.get('store_version') != SCORE_STORE_VERSION:
+            return empty_store
+        
+        if not all(isinstance(store.get(key), dict) for key in ('skill_databases', 'resume', 'jobs')):
+            self.logger.warning(f"Malformed score store {store_path}, rebuilding")
+            return empty_store
+        
+        return store
+    
+    def save_score_store(self, store, store_path):
+        """Write the score store atomically"""
+        directory = os.path.dirname(store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        # Keep only skill database snapshots that stored jobs still refer to
+        used_versions = {job['inputs']['skill_db_version'] for job in store['jobs'].values()}
+        store['skill_databases'] = {
+            version: skills for version, skills in store['skill_databases'].items()
+            if version in used_versions
+        }
+        
+        temp_path = store_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(store, f)
+        os.replace(temp_path, store_path)
+    
+    def analyze_resume(self, resume_text, cached_resume):
+        """Build the resume profile, reusing NER output if the text is unchanged"""
+        text_hash = self.fingerprint(resume_text)
+        
+        if cached_resume.get('text_hash') == text_hash:
+            entities = cached_resume['entities']
+        else:
+            entities = self.extract_entities(resume_text)
+        
+        skills = set(self.find_keyword_skills(resume_text, self.all_skills()))
+        skills.update(self.match_entity_skills(entities))
+        
+        profile = {
+            'skills': sorted(skills),
+            'experience_years': self.extract_experience_years(resume_text)
+        }
+        
+        return {
+            'text_hash': text_hash,
+            'entities': entities,
+            'profile': profile,
+            'profile_version': self.fingerprint(profile)
+        }
+    
+    def rescore_jobs(self, resume_text, jobs, store_path='data/match_scores.json'):
+        """Re-score jobs, recomputing only components whose inputs changed
+        
+        Every stored score records the resume profile version, resume text hash,
+        skill database version, vectorizer version and job text hash it was
+        computed from. Text similarity is recomputed only when the resume text,
+        vectorizer or job text changes; skill matches are patched with the
+        added/removed skills when the skill database changes.
+        """
+        store = self.load_score_store(store_path)
+        
+        resume = self.analyze_resume(resume_text, store['resume'])
+        resume_skills = resume['profile']['skills']
+        resume_years = resume['profile']['experience_years']
+        
+        current_skills = self.all_skills()
+        skill_db_version = self.skill_database_version()
+        store['skill_databases'][skill_db_version] = current_skills
+        
+        current_inputs = {
+            'resume_profile_version': resume['profile_version'],
+            'resume_text_hash': resume['text_hash'],
+            'skill_db_version': skill_db_version,
+            'vectorizer_version': self.vectorizer_version()
+        }
+        
+        # (removed, added) skills per stored skill database version
+        skill_deltas = {}
+        
+        stats = {'jobs': 0, 'new': 0, 'text_similarity': 0, 'skill_match': 0, 'unchanged': 0}
+        results = []
+        seen_jobs = {}
+        
+        for job in jobs:
+            description = job.get('description', '')
+            if not description:
+                continue
+            
+            job_hash = self.fingerprint(description)
+            # JSON object keys are strings, so normalize ids to match the saved store
+            job_key = str(job.get('id') or job.get('link') or job_hash)
+            if job_key in seen_jobs and seen_jobs[job_key] != job_hash:
+                # Same id with different text: keep both under distinct stable keys
+                self.logger.warning(f"Duplicate job id {job_key} with different text")
+                job_key = f"{job_key}#{job_hash}"
+            if job_key in seen_jobs:
+                self.logger.warning(f"Skipping duplicate job {job_key}")
+                continue
+            seen_jobs[job_key] = job_hash
+            
+            record = store['jobs'].get(job_key)
+            inputs = dict(current_inputs, job_hash=job_hash)
+            stats['jobs'] += 1
+            
+            is_new = record is None or record['inputs']['job_hash'] != job_hash
+            if is_new:
+                # New or edited job text: nothing can be reused
+                stats['new'] += 1
+                record = {
+                    'entities': self.extract_entities(description),
+                    'keyword_skills': self.find_keyword_skills(description, current_skills),
+                    'experience_years': self.extract_experience_years(description),
+                    'components': {
+                        'text_similarity': self.calculate_text_similarity(resume_text, description)
+                    }
+                }
+                skills_changed = True
+                text_changed = False
+            else:
+                old_inputs = record['inputs']
+                
+                text_changed = (old_inputs['resume_text_hash'] != inputs['resume_text_hash'] or
+                                old_inputs['vectorizer_version'] != inputs['vectorizer_version'])
+                if text_changed:
+                    stats['text_similarity'] += 1
+                    record['components']['text_similarity'] = self.calculate_text_similarity(
+                        resume_text, description
+                    )
+                
+                skills_changed = old_inputs['resume_profile_version'] != inputs['resume_profile_version']
+                
+                old_version = old_inputs['skill_db_version']
+                if old_version != skill_db_version:
+                    skills_changed = True
+                    if old_version not in skill_deltas:
+                        old_skills = store['skill_databases'].get(old_version)
+                        if old_skills is None:
+                            skill_deltas[old_version] = None
+                        else:
+                            old_skills = set(old_skills)
+                            skill_deltas[old_version] = (
+                                old_skills - set(current_skills),
+                                [skill for skill in current_skills if skill not in old_skills]
+                            )
+                    
+                    delta = skill_deltas[old_version]
+                    if delta is None:
+                        # Snapshot missing, fall back to a full keyword scan
+                        record['keyword_skills'] = self.find_keyword_skills(description, current_skills)
+                    else:
+                        removed, added = delta
+                        record['keyword_skills'] = [
+                            skill for skill in record['keyword_skills'] if skill not in removed
+                        ] + self.find_keyword_skills(description, added)
+            
+            if not is_new:
+                if skills_changed:
+                    stats['skill_match'] += 1
+                elif not text_changed:
+                    stats['unchanged'] += 1
+            
+            if skills_changed:
+                job_skills = set(record['keyword_skills'])
+                job_skills.update(self.match_entity_skills(record['entities']))
+                job_skills = sorted(job_skills)
+                
+                record['components']['skill_match'] = self.skill_overlap(resume_skills, job_skills)
+                record['components']['skill_comparison'] = self.compare_skills(resume_skills, job_skills)
+                record['components']['experience_match'] = self.experience_score(
+                    resume_years, record['experience_years']
+                )
+            
+            components = record['components']
+            record['inputs'] = inputs
+            record['scores'] = self.build_match_result(
+                components['text_similarity'],
+                components['skill_match'],
+                components['experience_match'],
+                components['skill_comparison']
+            )
+            store['jobs'][job_key] = record
+            
+            results.append(dict(job, **record['scores']))
+        
+        # Drop jobs that are no longer in the archive
+        store['jobs'] = {key: record for key, record in store['jobs'].items() if key in seen_jobs}
+        store['resume'] = {'text_hash': resume['text_hash'], 'entities': resume['entities']}
+        self.save_score_store(store, store_path)
+        
+        results.sort(key=lambda result: result['overall_score'], reverse=True)
+        return results, stats
\ No newline at end of file
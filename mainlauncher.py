@@ -8,6 +8,7 @@ Main entry point for the automated job application system
 import argparse
 import sys
 import os
+import json
 import logging
 from datetime import datetime
 from backend_job_applicator import OffCampusAutoApplicator
@@ -57,9 +58,9 @@ def parse_arguments():
     parser.add_argument(
         '--mode',
         type=str,
-        choices=['auto', 'manual', 'test', 'scout'],
+        choices=['auto', 'manual', 'test', 'scout', 'rescore'],
         default='auto',
-        help='Application mode: auto (full automation), manual (with prompts), test (dry run), scout (only search)'
+        help='Application mode: auto (full automation), manual (with prompts), test (dry run), scout (only search), rescore (re-score job archive)'
     )
 
     parser.add_argument(
@@ -84,6 +85,33 @@ def parse_arguments():
         help='Path to resume file'
     )
 
+    parser.add_argument(
+        '--resume-text',
+        type=str,
+        default='./data/resume.txt',
+        help='Path to plain-text resume used for scoring (rescore mode)'
+    )
+
+    parser.add_argument(
+        '--jobs',
+        type=str,
+        default='./data/jobs_archive.json',
+        help='Path to JSON list of jobs with a description field (rescore mode)'
+    )
+
+    parser.add_argument(
+        '--scores',
+        type=str,
+        default='./data/match_scores.json',
+        help='Path to the stored match scores (rescore mode)'
+    )
+
+    parser.add_argument(
+        '--skills',
+        type=str,
+        help='Path to custom skill database JSON {category: [skills]}'
+    )
+
     parser.add_argument(
         '--keywords',
         type=str,
@@ -106,6 +134,55 @@ def parse_arguments():
 
     return parser.parse_args()
 
+def run_rescore(args, logger):
+    """Incrementally re-score the job archive against the resume"""
+    for path in (args.resume_text, args.jobs):
+        if not os.path.exists(path):
+            logger.error(f"File not found: {path}")
+            print(f"\n❌ ERROR: File not found at {path}")
+            sys.exit(1)
+    
+    with open(args.resume_text, 'r', encoding='utf-8') as f:
+        resume_text = f.read()
+    
+    try:
+        with open(args.jobs, 'r', encoding='utf-8') as f:
+            jobs = json.load(f)
+    except ValueError:
+        jobs = None
+    
+    if not isinstance(jobs, list) or not all(isinstance(job, dict) for job in jobs):
+        logger.error(f"Invalid jobs archive: {args.jobs}")
+        print(f"\n❌ ERROR: {args.jobs} must be a JSON list of job objects")
+        sys.exit(1)
+    
+    print("\n📊 RESCORE MODE - Updating match scores")
+    print("="*50)
+    print(f"Resume: {args.resume_text}")
+    print(f"Jobs archive: {args.jobs} ({len(jobs)} jobs)")
+    print(f"Score store: {args.scores}")
+    print("="*50)
+    
+    logger.info("Initializing Job Matcher...")
+    matcher = OffCampusJobMatcher(skill_database_path=args.skills)
+    
+    start = datetime.now()
+    results, stats = matcher.rescore_jobs(resume_text, jobs, args.scores)
+    elapsed = (datetime.now() - start).total_seconds()
+    
+    logger.info(f"Rescored {stats['jobs']} jobs in {elapsed:.2f}s: {stats}")
+    print(f"\n✅ Rescored {stats['jobs']} jobs in {elapsed:.2f}s")
+    print(f"   New jobs scored:          {stats['new']}")
+    print(f"   Text similarity updated:  {stats['text_similarity']}")
+    print(f"   Skill match updated:      {stats['skill_match']}")
+    print(f"   Unchanged:                {stats['unchanged']}")
+    
+    print(f"\n🏆 Top {min(args.limit, len(results))} matches:")
+    for result in results[:args.limit]:
+        title = result.get('title', result.get('link', 'Untitled'))
+        company = result.get('company', '')
+        print(f"   {result['overall_score']:6.2f}%  {title} {f'@ {company}' if company else ''}")
+
 def main():
     """Main execution function"""
     # Setup logging
@@ -123,6 +200,12 @@ def main():
     logger.info(f"Location: {args.location}")
     
     try:
+        if args.mode == 'rescore':
+            run_rescore(args, logger)
+            logger.info("JobPilot AI completed successfully")
+            print("\n✨ JobPilot AI execution completed!")
+            return
+        
         # Check if resume exists
         if not os.path.exists(args.resume):
             logger.error(f"Resume file not found: {args.resume}")
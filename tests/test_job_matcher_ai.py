@@ -0,0 +1,115 @@
+"""Tests for incremental re-scoring in job_matcher_ai"""
+
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("sklearn")
+
+
+class FakeNLP:
+    """Stand-in for the spaCy pipeline that counts calls and finds no entities"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return types.SimpleNamespace(ents=[])
+
+
+sys.modules.setdefault("spacy", types.SimpleNamespace(load=lambda name: FakeNLP()))
+
+from job_matcher_ai import OffCampusJobMatcher
+
+RESUME = "Python developer with 2 years of experience in Django, SQL and Docker"
+JOBS = [
+    {'id': 1, 'description': "Backend engineer using Python, Django and FastAPI. 1 year experience"},
+    {'id': 2, 'description': "Data analyst with SQL, Pandas and Tableau, 3+ years required"},
+    {'id': 3, 'description': "DevOps role: Docker, Kubernetes and AWS for FastAPI services"},
+]
+
+
+@pytest.fixture
+def matcher():
+    matcher = OffCampusJobMatcher()
+    matcher.nlp = FakeNLP()
+    return matcher
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    return str(tmp_path / 'match_scores.json')
+
+
+def assert_matches_full_scoring(matcher, resume_text, results):
+    for result in results:
+        expected = matcher.calculate_job_match_score(resume_text, result['description'])
+        assert {key: result[key] for key in expected} == expected
+
+
+def test_unchanged_inputs_reuse_scores(matcher, store_path):
+    first, stats = matcher.rescore_jobs(RESUME, JOBS, store_path)
+    assert stats['new'] == len(JOBS)
+
+    nlp_calls = matcher.nlp.calls
+    second, stats = matcher.rescore_jobs(RESUME, JOBS, store_path)
+
+    assert stats == {'jobs': 3, 'new': 0, 'text_similarity': 0, 'skill_match': 0, 'unchanged': 3}
+    assert matcher.nlp.calls == nlp_calls
+    assert second == first
+
+
+@pytest.mark.parametrize('change', ['add', 'remove'])
+def test_skill_change_only_updates_skill_match(matcher, store_path, change):
+    matcher.rescore_jobs(RESUME, JOBS, store_path)
+
+    if change == 'add':
+        matcher.skill_database['web_dev'].append('FastAPI')
+    else:
+        matcher.skill_database['devops'].remove('Docker')
+
+    results, stats = matcher.rescore_jobs(RESUME, JOBS, store_path)
+
+    assert stats['new'] == 0
+    assert stats['text_similarity'] == 0
+    assert stats['skill_match'] == len(JOBS)
+    assert_matches_full_scoring(matcher, RESUME, results)
+
+
+def test_resume_text_change_updates_text_similarity(matcher, store_path):
+    matcher.rescore_jobs(RESUME, JOBS, store_path)
+
+    resume_text = RESUME + " building REST services"
+    results, stats = matcher.rescore_jobs(resume_text, JOBS, store_path)
+
+    assert stats['new'] == 0
+    assert stats['text_similarity'] == len(JOBS)
+    # Same skills and experience, so the profile and skill scores are reused
+    assert stats['skill_match'] == 0
+    assert_matches_full_scoring(matcher, resume_text, results)
+
+
+def test_removed_and_duplicate_jobs(matcher, store_path):
+    jobs = JOBS + [{'id': 1, 'description': "Frontend role with React"}, dict(JOBS[1])]
+    results, stats = matcher.rescore_jobs(RESUME, jobs, store_path)
+    assert stats['jobs'] == 4
+
+    matcher.rescore_jobs(RESUME, JOBS[:1], store_path)
+    store = matcher.load_score_store(store_path)
+
+    assert list(store['jobs']) == ['1']
+
+
+def test_corrupt_store_is_rebuilt(matcher, store_path):
+    with open(store_path, 'w', encoding='utf-8') as f:
+        f.write('{"store_version": 1, "jobs": {')
+
+    results, stats = matcher.rescore_jobs(RESUME, JOBS, store_path)
+
+    assert stats['new'] == len(JOBS)
+    assert_matches_full_scoring(matcher, RESUME, results)